@@ -85,7 +85,6 @@ class Agent(Monitorable):
             return self._execute(context)
 
     def _execute(self, context: AgentContext) -> AgentResult:
-        executor = new_runner_executor("agent")
         try:
             context.logger.info('message="agent execution started"')
             while not context.budget.is_expired():
@@ -112,13 +111,15 @@ class Agent(Monitorable):
             return AgentResult()
         finally:
             context.logger.info('message="agent execution ended"')
-            executor.shutdown(wait=False, cancel_futures=True)
 
     def execute_plan(self, iteration_context: AgentContext, plan: Sequence[ExecutionUnit]):
-        executor = new_runner_executor("agent")
+        groups = self._group_units(plan)
+        # size the pool to the largest group so that all units of a group run concurrently
+        max_workers = min(32, max((len(group) for group in groups), default=1))
+        executor = new_runner_executor("agent", max_workers=max_workers)
         fs = []
         try:
-            for group in self._group_units(plan):
+            for group in groups:
                 fs = [executor.submit(self._execute_unit, iteration_context, unit) for unit in group]
                 dones, _ = futures.wait(fs, iteration_context.budget.remaining_duration, futures.FIRST_EXCEPTION)
                 # rethrow exception if any
@@ -126,6 +127,7 @@ class Agent(Monitorable):
         finally:
             for f in fs:
                 f.cancel()
+            executor.shutdown(wait=False, cancel_futures=True)
 
     @staticmethod
     def _group_units(plan: Sequence[ExecutionUnit]) -> List[List[ExecutionUnit]]:
@@ -1,7 +1,7 @@
 from typing import Optional
 
 from council.chains import ChainBase
-from council.contexts import AgentContext, ChainContext, ChatMessage, Monitored
+from council.contexts import AgentContext, ChainContext, ChatMessageKind, Monitored
 from council.runners import RunnerExecutor
 
 from .agent import Agent
@@ -30,7 +30,6 @@ class AgentChain(ChainBase):
 
     def _execute(self, context: ChainContext, _executor: Optional[RunnerExecutor] = None) -> None:
         result = self.agent.execute(AgentContext.from_chat_history(context.chat_history))
-        maybe_message = result.try_best_message
-        if maybe_message.is_some():
-            message = maybe_message.unwrap()
-            context.append(ChatMessage.skill(message.message, message.data, message.source, message.is_error))
+        message = result.try_best_message.as_optional()
+        if message is not None:
+            context.append(message.with_kind(ChatMessageKind.Skill))
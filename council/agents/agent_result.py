@@ -1,4 +1,5 @@
 from collections.abc import Sequence
+from operator import attrgetter
 from typing import List, Optional
 
 from council.contexts import ChatMessage, ScoredChatMessage
@@ -40,7 +41,7 @@ class AgentResult:
         Raises:
             ValueError: there is no messages
         """
-        return max(self._messages, key=lambda item: item.score).message
+        return max(self._messages, key=attrgetter("score")).message
 
     @property
     def try_best_message(self) -> Option[ChatMessage]:
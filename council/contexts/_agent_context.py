@@ -33,7 +33,8 @@ class AgentContext(ContextBase):
     @staticmethod
     def from_chat_history(chat_history: ChatHistory, budget: Optional[Budget] = None) -> AgentContext:
         """
-        creates a new instance from a :class:`ChatHistory`
+        creates a new instance from a :class:`ChatHistory`.
+        The chat history is shared with the new context, not copied.
 
         Args:
             chat_history (ChatHistory): The chat history to initialize the new agent context
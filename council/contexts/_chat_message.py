@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import sys
 from enum import Enum
 from typing import Any, Dict
 
@@ -30,14 +31,30 @@ class ChatMessageKind(str, Enum):
     """
 
     def __str__(self) -> str:
-        return f"{self.value}"
+        return self._value_
+
+
+_USER = ChatMessageKind.User
+_AGENT = ChatMessageKind.Agent
+_CHAIN = ChatMessageKind.Chain
+_SKILL = ChatMessageKind.Skill
 
 
 class ChatMessage:
     """
     Represents a chat message.
+
+    Attributes:
+        message (str): the message content as readable text
+        kind (ChatMessageKind): the kind of message
+        data (Any): structured data associated with the message, if any
+        source (str): the source of the message, when it is generated by Council
+        is_error (bool): is the message considered an error
     """
 
+    __slots__ = ("message", "kind", "data", "source", "is_error")
+    __match_args__ = ("kind", "message", "source", "is_error")
+
     def __init__(self, message: str, kind: ChatMessageKind, data: Any = None, source: str = "", is_error: bool = False):
         """
         Initialize a new instance
@@ -49,11 +66,12 @@ class ChatMessage:
             source(str): the source of the message, when it is generated by Council
             is_error(bool): is the message considered an error
         """
-        self._message: str = message
-        self._kind: ChatMessageKind = kind
-        self._data: Any = data
-        self._source: str = source
-        self._is_error: bool = is_error
+        self.message: str = message
+        self.kind: ChatMessageKind = kind
+        self.data: Any = data
+        # only exact `str` can be interned; str subclasses (e.g. str-based enums) are kept as given
+        self.source: str = sys.intern(source) if type(source) is str else source
+        self.is_error: bool = is_error
 
     @staticmethod
     def agent(message: str, data: Any = None, source: str = "", is_error: bool = False) -> ChatMessage:
@@ -61,7 +79,7 @@ class ChatMessage:
         Helper function to create message of kind :attr:`ChatMessageKind.Agent`.
           See :meth:`ChatMessage.__init__` for details
         """
-        return ChatMessage(message, ChatMessageKind.Agent, data, source, is_error)
+        return ChatMessage(message, _AGENT, data, source, is_error)
 
     @staticmethod
     def user(message: str, data: Any = None, source: str = "", is_error: bool = False) -> ChatMessage:
@@ -69,7 +87,7 @@ class ChatMessage:
         Helper function to create message of kind :attr:`ChatMessageKind.User`.
           See :meth:`ChatMessage.__init__` for details
         """
-        return ChatMessage(message, ChatMessageKind.User, data, source, is_error)
+        return ChatMessage(message, _USER, data, source, is_error)
 
     @staticmethod
     def skill(message: str, data: Any = None, source: str = "", is_error: bool = False) -> ChatMessage:
@@ -77,7 +95,7 @@ class ChatMessage:
         Helper function to create message of kind :attr:`ChatMessageKind.Skill`.
           See :meth:`ChatMessage.__init__` for details
         """
-        return ChatMessage(message, ChatMessageKind.Skill, data, source, is_error)
+        return ChatMessage(message, _SKILL, data, source, is_error)
 
     @staticmethod
     def chain(message: str, data: Any = None, source: str = "", is_error: bool = False) -> ChatMessage:
@@ -85,140 +103,67 @@ class ChatMessage:
         Helper function to create message of kind :attr:`ChatMessageKind.Chain`.
           See :meth:`ChatMessage.__init__` for details
         """
-        return ChatMessage(message, ChatMessageKind.Chain, data, source, is_error)
-
-    @property
-    def message(self) -> str:
-        """
-        The readable text message
+        return ChatMessage(message, _CHAIN, data, source, is_error)
 
-        Returns:
-            str:
+    def with_kind(self, kind: ChatMessageKind) -> ChatMessage:
         """
-        return self._message
-
-    @property
-    def kind(self) -> ChatMessageKind:
+        Returns a copy of this message with the given kind.
+          The copy shares the message, data and source of this instance.
         """
-        The kind of message
-
-        Returns:
-            ChatMessageKind:
-        """
-        return self._kind
+        result = ChatMessage.__new__(ChatMessage)
+        result.message = self.message
+        result.kind = kind
+        result.data = self.data
+        result.source = self.source
+        result.is_error = self.is_error
+        return result
 
     @property
     def is_kind_skill(self) -> bool:
-        """
-        `True` if the kind is :attr:`ChatMessageKind.Skill`, otherwise `False`
-
-        Returns:
-            bool:
-        """
-        return self._kind == ChatMessageKind.Skill
+        """`True` if the kind is :attr:`ChatMessageKind.Skill`, otherwise `False`"""
+        return self.kind is _SKILL
 
     @property
     def is_kind_agent(self) -> bool:
-        """
-        `True` if the kind is :attr:`ChatMessageKind.Agent`, otherwise `False`
-
-        Returns:
-            bool:
-        """
-        return self._kind == ChatMessageKind.Agent
+        """`True` if the kind is :attr:`ChatMessageKind.Agent`, otherwise `False`"""
+        return self.kind is _AGENT
 
     @property
     def is_kind_chain(self) -> bool:
-        """
-        `True` if the kind is :attr:`ChatMessageKind.Chain`, otherwise `False`
-
-        Returns:
-            bool:
-        """
-        return self._kind == ChatMessageKind.Chain
+        """`True` if the kind is :attr:`ChatMessageKind.Chain`, otherwise `False`"""
+        return self.kind is _CHAIN
 
     @property
     def is_kind_user(self) -> bool:
-        """
-        `True` if the kind is :attr:`ChatMessageKind.User`, otherwise `False`
-
-        Returns:
-            bool:
-        """
-        return self._kind == ChatMessageKind.User
-
-    @property
-    def data(self) -> Any:
-        """
-        Returns the data, if any, associated with the message.
-
-        Returns:
-            Any:
-        """
-        return self._data
-
-    @property
-    def source(self) -> str:
-        """
-        Returns the source of the message
-
-        Returns:
-            str:
-        """
-        return self._source
+        """`True` if the kind is :attr:`ChatMessageKind.User`, otherwise `False`"""
+        return self.kind is _USER
 
     @property
     def is_ok(self) -> bool:
-        """
-        Returns `True` if the message is ok (not an error), `False` otherwise
-
-        Returns:
-            bool:
-        """
-        return not self._is_error
-
-    @property
-    def is_error(self) -> bool:
-        """
-        Returns `True` if the message is an error, `False` otherwise
-
-        Returns:
-            bool:
-        """
-        return self._is_error
+        """`True` if the message is ok (not an error), otherwise `False`"""
+        return not self.is_error
 
     def is_of_kind(self, kind: ChatMessageKind) -> bool:
-        """
-        Returns `True` if the message is of the given kind, otherwise `False`
-
-        Returns:
-            bool:
-        """
-        return self._kind == kind
+        """Returns `True` if the message is of the given kind, otherwise `False`"""
+        return self.kind is kind
 
     def is_from_source(self, source: str) -> bool:
-        """
-        Returns `True` if the message is of the given source, otherwise `False`
-
-        Args:
-            source:
-
-        Returns:
-
-        """
-        return self._source == source
+        """Returns `True` if the message is of the given source, otherwise `False`"""
+        return self.source is source or self.source == source
 
     def __str__(self) -> str:
-        return f"{self.kind}: {self.message}"
+        return self.kind._value_ + ": " + self.message
 
     def to_string(self, max_length: int = 50) -> str:
-        message = self.message[:max_length] + "..." if len(self.message) > max_length else self.message
-        return f"Message of kind {self.kind}: {message}"
+        message = self.message
+        if len(message) > max_length:
+            message = message[:max_length] + "..."
+        return "Message of kind " + self.kind._value_ + ": " + message
 
     def to_dict(self) -> Dict[str, Any]:
         return {
             "is_error": self.is_error,
-            "kind": self.kind.value,
+            "kind": self.kind._value_,
             "message": self.message,
             "source": self.source,
         }
@@ -233,19 +178,16 @@ class ScoredChatMessage:
         score: a score reflecting the quality of the message
     """
 
+    __slots__ = ("message", "score")
+
     def __init__(self, message: ChatMessage, score: float) -> None:
         self.message = message
         self.score = score
 
-    def __gt__(self, other: ScoredChatMessage) -> bool:
-        return self.score > other.score
-
+    # `>` and `>=` are served by the reflected `__lt__` and `__le__`
     def __lt__(self, other: ScoredChatMessage) -> bool:
         return self.score < other.score
 
-    def __ge__(self, other: ScoredChatMessage) -> bool:
-        return self.score >= other.score
-
     def __le__(self, other: ScoredChatMessage) -> bool:
         return self.score <= other.score
 
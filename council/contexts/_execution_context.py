@@ -13,14 +13,17 @@ class ExecutionContext:
     context storing the execution information
     """
 
+    __slots__ = ("_executionLog", "_entry", "_path_prefix")
+
     def __init__(
         self, execution_log: Optional[ExecutionLog] = None, path: str = "", node: Optional[Monitorable] = None
     ) -> None:
         self._executionLog: ExecutionLog = execution_log or ExecutionLog()
         self._entry: ExecutionLogEntry = self._executionLog.new_entry(path, node)
+        self._path_prefix = "" if self._entry.source == "" else self._entry.source + "/"
 
     def _new_path(self, name: str) -> str:
-        return name if self._entry.source == "" else f"{self._entry.source}/{name}"
+        return self._path_prefix + name
 
     def new_from_name(self, name: str) -> ExecutionContext:
         """
@@ -107,7 +107,7 @@ class MessageCollection(abc.ABC):
         """
 
         def predicate(message: ChatMessage) -> bool:
-            return message.is_of_kind(ChatMessageKind.Skill) and message.is_from_source(skill_name)
+            return message.kind is ChatMessageKind.Skill and message.source == skill_name
 
         return self._last_message_filter(predicate)
 
@@ -132,4 +132,4 @@ class MessageCollection(abc.ABC):
 
     @staticmethod
     def message_kind_predicate(kind: ChatMessageKind) -> Callable[[ChatMessage], bool]:
-        return lambda m: m.is_of_kind(kind)
+        return lambda m: m.kind is kind
@@ -1,17 +1,19 @@
-from typing import List, Optional, Sequence, Tuple
+from typing import Dict, List, Optional, Sequence, Tuple
 
 from council.chains import ChainBase
-from council.contexts import AgentContext, ChatMessage, ContextBase
+from council.contexts import AgentContext, ChatMessage, ContextBase, LLMContext
 from council.controllers import ControllerBase, ControllerException
-from council.llm import LLMBase, LLMMessage, MonitoredLLM
+from council.llm import LLMBase, LLMCachingMiddleware, LLMMessage, LLMRequest, LLMResponse, LLMResult, MonitoredLLM
 from council.llm.base.llm_answer import LLMAnswer, LLMParsingException, llm_class_validator, llm_property
 from council.utils import Option
-from typing_extensions import TypeGuard
+from council.utils.utils import DurationManager
 
 from .execution_unit import ExecutionUnit
 
 
 class Specialist:
+    __slots__ = ("_instructions", "_score", "_name", "_justification")
+
     def __init__(self, name: str, justification: str, instructions: str, score: int) -> None:
         self._instructions = instructions
         self._score = score
@@ -61,15 +63,19 @@ class LLMController(ControllerBase):
         response_threshold: float = 0.0,
         top_k: Optional[int] = None,
         parallelism: bool = False,
+        llm_cache: Optional[LLMCachingMiddleware] = None,
     ):
         """
         Initialize a new instance of an LLMController
 
         Parameters:
-            llm (LLMBase): the instance of LLM to use
+            llm (LLMBase): the instance of LLM to use. When it returns several choices, the first one
+                correctly formatted is used
             response_threshold (float): a minimum threshold to select a response from its score
             top_k (int): maximum number of execution plan returned
             parallelism (bool): If true, Build a plan that will be executed in parallel
+            llm_cache (Optional[LLMCachingMiddleware]): an optional cache for the LLM responses,
+                to avoid scoring the same user task again
         """
         super().__init__(chains=chains, parallelism=parallelism)
         self._llm: MonitoredLLM = self.register_monitor(MonitoredLLM("llm", llm))
@@ -78,33 +84,59 @@ class LLMController(ControllerBase):
             self._top_k = len(self._chains)
         else:
             self._top_k = min(top_k, len(self._chains))
+        self._chains_by_name: Dict[str, ChainBase] = {}
+        for chain in self._chains:
+            self._chains_by_name.setdefault(chain.name.casefold(), chain)
         self._llm_answer = LLMAnswer(Specialist)
         self._llm_system_message = self._build_system_message()
+        self._specialists = self._build_specialists()
+        self._llm_cache = llm_cache
         self._retry = 3
 
     def _execute(self, context: AgentContext) -> List[ExecutionUnit]:
-        retry = self._retry
         messages = self._build_llm_messages(context)
-        new_messages: List[LLMMessage] = []
-        while retry > 0:
-            messages = messages + new_messages
-            llm_result = self._llm.post_chat_request(context, messages)
-            response = llm_result.first_choice
-            context.logger.debug(f"llm response: {response}")
-            try:
-                retry -= 1
-                plan = self._parse_response(context, response)
-                plan.sort(key=lambda item: item[1], reverse=True)
-                return [item[0] for item in plan if item[1] >= self._response_threshold][: self._top_k]
-            except LLMParsingException as e:
-                assistant_message = f"Your response is not correctly formatted:\n{response}"
-                new_messages = self._handle_error(e, assistant_message, context)
-            except ControllerException as e:
-                assistant_message = f"Your response raised an exception:\n{response}"
-                new_messages = self._handle_error(e, assistant_message, context)
+        for _ in range(self._retry):
+            llm_result = self._post_chat_request(context, messages)
+            errors: List[Tuple[Exception, str]] = []
+            # an LLM configured to return several completions (e.g. `n` > 1) is given a chance with each
+            # of them before asking it to fix its response
+            for response in llm_result.choices:
+                context.logger.debug(f"llm response: {response}")
+                try:
+                    return self._build_plan(context, response)
+                except LLMParsingException as e:
+                    errors.append((e, f"Your response is not correctly formatted:\n{response}"))
+                except ControllerException as e:
+                    errors.append((e, f"Your response raised an exception:\n{response}"))
+
+            if len(errors) > 0:
+                error, assistant_message = errors[0]
+                messages.extend(self._handle_error(error, assistant_message, context))
 
         raise ControllerException(f"LLMController failed to execute after {self._retry} retries.")
 
+    def _build_plan(self, context: AgentContext, response: str) -> List[ExecutionUnit]:
+        plan = self._parse_response(context, response)
+        plan.sort(key=lambda item: item[1].score, reverse=True)
+        selected = [item for item in plan if item[1].score >= self._response_threshold][: self._top_k]
+        return [
+            self._build_execution_unit(chain, context, specialist.instructions, specialist.score)
+            for chain, specialist in selected
+        ]
+
+    def _post_chat_request(self, context: AgentContext, messages: List[LLMMessage]) -> LLMResult:
+        if self._llm_cache is None:
+            return self._llm.post_chat_request(context, messages)
+
+        # snapshot the conversation: the cached request must not follow the retries appended to `messages`
+        request = LLMRequest(LLMContext.from_context(context, self._llm), list(messages))
+        return self._llm_cache(self._llm.inner, self._execute_llm_request, request).result
+
+    def _execute_llm_request(self, request: LLMRequest) -> LLMResponse:
+        with DurationManager() as timer:
+            result = self._llm.inner.post_chat_request(request.context, request.messages, **request.kwargs)
+        return LLMResponse(request, result, timer.duration)
+
     @staticmethod
     def _handle_error(e: Exception, assistant_message: str, context: ContextBase) -> List[LLMMessage]:
         error = f"{e.__class__.__name__}: `{e}`"
@@ -119,12 +151,14 @@ class LLMController(ControllerBase):
         if message.is_none():
             raise Exception("No user message.")
 
-        user_message = "\n".join(
+        user_message = f"{self._specialists}\n\n{self._get_main_instruction()} for:\n `{message.unwrap().message}`"
+        return LLMMessage.user_message(user_message)
+
+    def _build_specialists(self) -> str:
+        return "\n".join(
             ["# SPECIALISTS"]
             + [f"name: {c.name};description: {c.description};{c.is_supporting_instructions}" for c in self._chains]
-            + [f"\n{self._get_main_instruction()} for:\n `{message.unwrap().message}`"]
         )
-        return LLMMessage.user_message(user_message)
 
     def _build_system_message(self) -> LLMMessage:
         instruction = self._get_main_instruction()
@@ -151,14 +185,14 @@ class LLMController(ControllerBase):
             return "Score only the most relevant and best Specialist"
         return "Score all Specialists"
 
-    def _parse_response(self, context: AgentContext, response: str) -> List[Tuple[ExecutionUnit, int]]:
+    def _parse_response(self, context: AgentContext, response: str) -> List[Tuple[ChainBase, Specialist]]:
         parsed = [self._parse_line(context, line) for line in response.strip().splitlines()]
         filtered = [r.unwrap() for r in parsed if r.is_some()]
         if len(filtered) == 0:
             raise LLMParsingException("None of your response could be parsed. Follow exactly formatting instructions.")
 
         if self._top_k > 1:
-            actual_chains = [item[0].chain.name for item in filtered]
+            actual_chains = {item[0].name for item in filtered}
             missing_chains = [chain.name for chain in self._chains if chain.name not in actual_chains]
             if len(missing_chains) > 0:
                 raise ControllerException(f"Missing scores for {missing_chains}. Follow exactly your instructions.")
@@ -168,33 +202,19 @@ class LLMController(ControllerBase):
 
         return filtered
 
-    def _parse_line(self, context: AgentContext, line: str) -> Option[Tuple[ExecutionUnit, int]]:
+    def _parse_line(self, context: AgentContext, line: str) -> Option[Tuple[ChainBase, Specialist]]:
         if LLMAnswer.field_separator() not in line:
             return Option.none()
 
         scored_specialist: Optional[Specialist] = self._llm_answer.to_object(line)
         if scored_specialist is not None:
-
-            def typeguard_predicate(chain_base: ChainBase) -> TypeGuard[ChainBase]:
-                return (
-                    isinstance(chain_base, ChainBase)
-                    and chain_base.name.casefold() == scored_specialist.name.casefold()
-                )
-
-            try:
-                chain = next(filter(typeguard_predicate, self._chains))
-                context.logger.debug(f"{scored_specialist}")
-                return Option.some(
-                    (
-                        self._build_execution_unit(
-                            chain, context, scored_specialist.instructions, scored_specialist.score
-                        ),
-                        scored_specialist.score,
-                    )
-                )
-            except StopIteration as e:
+            chain = self._chains_by_name.get(scored_specialist.name.casefold())
+            if chain is None:
                 context.logger.warning(f'message="no chain found with name `{scored_specialist.name}`"')
-                raise ControllerException(f"The Specialist `{scored_specialist.name}` does not exist.") from e
+                raise ControllerException(f"The Specialist `{scored_specialist.name}` does not exist.")
+
+            context.logger.debug(f"{scored_specialist}")
+            return Option.some((chain, scored_specialist))
         return Option.none()
 
     def _build_execution_unit(
@@ -4,7 +4,7 @@ LLMEvaluator implementation.
 This evaluator uses the given `LLM` to evaluate the chain's responses.
 """
 
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 from council.contexts import AgentContext, ChatMessage, ContextBase, ScoredChatMessage
 from council.evaluators import EvaluatorBase, EvaluatorException
@@ -65,12 +65,8 @@ class LLMEvaluator(EvaluatorBase):
             if chain_messages.try_last_message.is_some()
         ]
 
-        retry = self._retry
         messages = self._build_llm_messages(query, chain_results)
-        new_messages: List[LLMMessage] = []
-        while retry > 0:
-            retry -= 1
-            messages = messages + new_messages
+        for _ in range(self._retry):
             llm_result = self._llm.post_chat_request(context, messages)
             response = llm_result.first_choice
             context.logger.debug(f"llm response: {response}")
@@ -79,10 +75,10 @@ class LLMEvaluator(EvaluatorBase):
                 return parse_response
             except LLMParsingException as e:
                 assistant_message = f"Your response is not correctly formatted:\n{response}"
-                new_messages = self._handle_error(e, assistant_message, context)
+                messages.extend(self._handle_error(e, assistant_message, context))
             except EvaluatorException as e:
                 assistant_message = f"Your response raised an exception:\n{response}"
-                new_messages = self._handle_error(e, assistant_message, context)
+                messages.extend(self._handle_error(e, assistant_message, context))
 
         raise EvaluatorException(f"LLMEvaluator failed to execute after {self._retry} retries")
 
@@ -100,18 +96,23 @@ class LLMEvaluator(EvaluatorBase):
         if len(grades) == 0:
             raise LLMParsingException("None of your grade could be parsed. Follow exactly formatting instructions.")
 
+        grades_by_index: Dict[int, SpecialistGrade] = {}
+        for grade in grades:
+            grades_by_index.setdefault(grade.index, grade)
+
         scored_messages = []
         missing_indexes = []
-        for idx, message in enumerate(chain_results):
-            try:
-                grade = next(filter(lambda item: item.index == (idx + 1), grades))
-                scored_message = ScoredChatMessage(
-                    ChatMessage.agent(message=message.message, data=message.data), grade.grade
-                )
-                scored_messages.append(scored_message)
-                context.logger.debug(f"{grade} Graded message: `{message.message}`")
-            except StopIteration:
-                missing_indexes.append(idx + 1)
+        for idx, message in enumerate(chain_results, start=1):
+            message_grade = grades_by_index.get(idx)
+            if message_grade is None:
+                missing_indexes.append(idx)
+                continue
+
+            scored_message = ScoredChatMessage(
+                ChatMessage.agent(message=message.message, data=message.data), message_grade.grade
+            )
+            scored_messages.append(scored_message)
+            context.logger.debug(f"{message_grade} Graded message: `{message.message}`")
 
         if len(missing_indexes) > 1:
             missing_msg = f"Missing grade for the answers with indexes {missing_indexes}."
@@ -63,12 +63,8 @@ class LLMFilter(FilterBase):
         if len(self._filter_on) == 0:
             return all_eval_results
 
-        retry = self._retry
         messages = self._build_llm_messages(all_eval_results)
-        new_messages: List[LLMMessage] = []
-        while retry > 0:
-            retry -= 1
-            messages = messages + new_messages
+        for _ in range(self._retry):
             llm_result = self._llm.post_chat_request(context, messages)
             response = llm_result.first_choice
             context.logger.debug(f"llm response: {response}")
@@ -76,10 +72,10 @@ class LLMFilter(FilterBase):
                 return self._parse_response(context, response, all_eval_results)
             except LLMParsingException as e:
                 assistant_message = f"Your response is not correctly formatted:\n{response}"
-                new_messages = self._handle_error(e, assistant_message, context)
+                messages.extend(self._handle_error(e, assistant_message, context))
             except FilterException as e:
                 assistant_message = f"Your response raised an exception:\n{response}"
-                new_messages = self._handle_error(e, assistant_message, context)
+                messages.extend(self._handle_error(e, assistant_message, context))
 
         raise FilterException(f"LLMFilter failed to execute after {self._retry} retries")
 
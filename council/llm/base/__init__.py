@@ -1,4 +1,4 @@
-from typing import Optional, Type
+from typing import Mapping, Optional, Type
 
 from .llm_config_object import LLMProvider, LLMConfigObject, LLMConfigSpec, LLMProviders
 from .llm_answer import llm_property, LLMAnswer, LLMProperty, LLMParsingException
@@ -40,16 +40,19 @@ from .providers import (
 from ...utils import read_env_str
 
 
+# accepts provider names with or without the `spec` suffix, e.g. `openai` or `openAISpec`
+_DEFAULT_LLM_BY_PROVIDER_NAME: Mapping[str, Type[LLMBase]] = {
+    name: llm_class
+    for provider, llm_class in _PROVIDER_TO_LLM.items()
+    for name in (provider.lower(), provider.lower().removesuffix("spec"))
+}
+
+
 def get_default_llm(max_retries: Optional[int] = None) -> LLMBase:
     """Get default LLM based on `COUNCIL_DEFAULT_LLM_PROVIDER` env variable."""
-    provider_str = read_env_str("COUNCIL_DEFAULT_LLM_PROVIDER", default=LLMProviders.OpenAI).unwrap()
-    provider_str = provider_str.lower() + "spec"
-
-    llm_class: Optional[Type[LLMBase]] = next(
-        (llm_class for provider_enum, llm_class in _PROVIDER_TO_LLM.items() if provider_str == provider_enum.lower()),
-        None,
-    )
+    provider_str = read_env_str("COUNCIL_DEFAULT_LLM_PROVIDER", required=False, default=LLMProviders.OpenAI).unwrap()
 
+    llm_class = _DEFAULT_LLM_BY_PROVIDER_NAME.get(provider_str.lower())
     if llm_class is None:
         raise ValueError(f"Provider {provider_str} not supported by Council.")
 
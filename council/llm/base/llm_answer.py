@@ -83,6 +83,9 @@ class LLMAnswer:
                 self._valid_func = attr_value.f
         properties.sort(key=lambda item: item.rank)
         self._properties = properties
+        self._properties_by_name: Dict[str, LLMProperty] = {}
+        for prop in properties:
+            self._properties_by_name.setdefault(prop.name.casefold(), prop)
 
     @staticmethod
     def field_separator() -> str:
@@ -157,7 +160,4 @@ class LLMAnswer:
         return {}
 
     def _find(self, prop: str) -> Optional[LLMProperty]:
-        for p in self._properties:
-            if p.name.casefold() == prop.casefold():
-                return p
-        return None
+        return self._properties_by_name.get(prop.casefold())
@@ -4,7 +4,6 @@ import os
 from enum import Enum
 from typing import Any, Dict, List, Mapping, Optional
 
-import yaml
 from council.utils import DataObject, DataObjectSpecBase
 from council.utils.parameter import Undefined
 
@@ -132,7 +131,6 @@ class LLMConfigObject(DataObject[LLMConfigSpec]):
 
     @classmethod
     def from_yaml(cls, filename: str) -> LLMConfigObject:
-        with open(filename, "r", encoding="utf-8") as f:
-            values = yaml.safe_load(f)
-            cls._check_kind(values, "LLMConfig")
-            return LLMConfigObject.from_dict(values)
+        values = cls._load_yaml(filename)
+        cls._check_kind(values, "LLMConfig")
+        return LLMConfigObject.from_dict(values)
@@ -4,7 +4,6 @@ import abc
 from enum import Enum
 from typing import Any, Dict, List, Optional, Tuple
 
-import yaml
 from council.contexts import Consumption
 from council.utils import DataObject, DataObjectSpecBase
 
@@ -177,10 +176,9 @@ class LLMCostManagerObject(DataObject[LLMCostManagerSpec]):
 
     @classmethod
     def from_yaml(cls, filename: str) -> LLMCostManagerObject:
-        with open(filename, "r", encoding="utf-8") as f:
-            values = yaml.safe_load(f)
-            cls._check_kind(values, "LLMCostManager")
-            return LLMCostManagerObject.from_dict(values)
+        values = cls._load_yaml(filename)
+        cls._check_kind(values, "LLMCostManager")
+        return LLMCostManagerObject.from_dict(values)
 
     def get_cost_map(self, category: str) -> Dict[str, LLMCostCard]:
         """Get cost mapping {model: LLMCostCard} for a given category"""
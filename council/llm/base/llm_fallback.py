@@ -68,6 +68,9 @@ class LLMFallback(LLMBase[LLMFallbackConfiguration]):
         try:
             return self._llm_call_with_retry(context, messages, **kwargs)
         except Exception as base_exception:
+            if self.fallback is self.llm and not self._is_retryable_exception(base_exception):
+                # falling back on the same llm would only replay the request to the same error
+                raise
             try:
                 return self.fallback.post_chat_request(context.new_for(self._fallback), messages, **kwargs)
             except Exception as e:
@@ -88,6 +91,10 @@ class LLMFallback(LLMBase[LLMFallbackConfiguration]):
                 raise
         raise LLMException(message=f"Main LLM failed after {retry_count} retries", llm_name=self._llm.name)
 
+    @staticmethod
+    def _is_retryable_exception(e: Exception) -> bool:
+        return not isinstance(e, LLMCallException) or LLMFallback._is_retryable(e.code)
+
     @staticmethod
     def _is_retryable(code: int) -> bool:
         return code == 408 or code == 429 or code == 503 or code == 504
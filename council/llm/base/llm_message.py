@@ -211,9 +211,9 @@ class LLMMessage:
     @staticmethod
     def from_chat_message(chat_message: ChatMessage) -> Optional[LLMMessage]:
         """Convert :class:`~.ChatMessage` into :class:`.LLMMessage`"""
-        if chat_message.kind == ChatMessageKind.User:
+        if chat_message.kind is ChatMessageKind.User:
             return LLMMessage.user_message(chat_message.message)
-        elif chat_message.kind == ChatMessageKind.Agent:
+        elif chat_message.kind is ChatMessageKind.Agent:
             return LLMMessage.assistant_message(chat_message.message)
         return None
 
@@ -20,10 +20,7 @@ _PROVIDER_TO_LLM: Mapping[LLMProviders, Type[LLMBase]] = {
 def _build_llm(llm_config: LLMConfigObject) -> LLMBase:
     provider = llm_config.spec.provider
 
-    llm_class: Optional[Type[LLMBase]] = next(
-        (llm_class for provider_enum, llm_class in _PROVIDER_TO_LLM.items() if provider.is_of_kind(provider_enum)), None
-    )
-
+    llm_class: Optional[Type[LLMBase]] = _PROVIDER_TO_LLM.get(provider.kind)
     if llm_class is None:
         raise ValueError(f"Provider `{provider.kind}` not supported by Council")
 
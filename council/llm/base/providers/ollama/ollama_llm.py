@@ -70,7 +70,7 @@ class OllamaLLM(LLMBase[OllamaLLMConfiguration]):
 
     @staticmethod
     def _build_messages_payload(messages: Sequence[LLMMessage]) -> List[Message]:
-        return [Message(role=message.role.value, content=message.content) for message in messages]
+        return [Message(role=message.role._value_, content=message.content) for message in messages]
 
     @staticmethod
     def _to_choices(response: Mapping[str, Any]) -> List[str]:
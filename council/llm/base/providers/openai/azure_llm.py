@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import weakref
 from typing import Any, Optional
 
 import httpx
@@ -18,19 +19,19 @@ class AzureOpenAIChatCompletionsModelProvider:
 
     def __init__(self, config: AzureChatGPTConfiguration, name: Optional[str]) -> None:
         self.config = config
-        self._uri = (
-            f"{self.config.api_base.value}/openai/deployments/{self.config.deployment_name.value}/chat/completions"
-        )
         self._name = name
+        # the client is kept to reuse its connections; everything else is read from the config on each request
+        self._client = httpx.Client()
+        weakref.finalize(self, self._client.close)
 
     def post_request(self, payload: dict[str, Any]) -> httpx.Response:
+        uri = f"{self.config.api_base.value}/openai/deployments/{self.config.deployment_name.value}/chat/completions"
         headers = {"api-key": self.config.api_key.unwrap(), "Content-Type": "application/json"}
         params = {"api-version": self.config.api_version.value}
 
         timeout = self.config.timeout.value
         try:
-            with httpx.Client(timeout=timeout) as client:
-                return client.post(url=self._uri, headers=headers, params=params, json=payload)
+            return self._client.post(url=uri, headers=headers, params=params, json=payload, timeout=timeout)
         except TimeoutException as e:
             raise LLMCallTimeoutException(timeout, self._name) from e
         except HTTPStatusError as e:
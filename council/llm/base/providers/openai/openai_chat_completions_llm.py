@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import logging
 from typing import Any, Dict, List, Optional, Protocol, Sequence
 
 import httpx
@@ -12,12 +13,16 @@ from ...llm_message import LLMMessage, LLMMessageTokenCounterBase
 from .chat_gpt_configuration import ChatGPTConfigurationBase
 from .openai_llm_cost import OpenAIConsumptionCalculator, Usage
 
+logger = logging.getLogger(__name__)
+
 
 class Provider(Protocol):
     def __call__(self, payload: dict[str, Any]) -> httpx.Response: ...
 
 
 class Message:
+    __slots__ = ("_content", "_role")
+
     def __init__(self, role: str, content: str) -> None:
         self._content = content
         self._role = role
@@ -34,6 +39,8 @@ class Message:
 
 
 class Choice:
+    __slots__ = ("_index", "_finish_reason", "_message")
+
     def __init__(self, index: int, finish_reason: str, message: Message) -> None:
         self._index = index
         self._finish_reason = finish_reason
@@ -52,6 +59,8 @@ class Choice:
 
 
 class OpenAIChatCompletionsResult:
+    __slots__ = ("_id", "_object", "_usage", "_model", "_choices", "_created", "_raw_response")
+
     def __init__(
         self,
         id: str,
@@ -127,14 +136,17 @@ class OpenAIChatCompletionsModel(LLMBase[ChatGPTConfigurationBase]):
         for key, value in kwargs.items():
             payload[key] = value
 
-        context.logger.debug(
-            f'message="Sending chat GPT completions request to {self._name}" payload="{truncate_dict_values_to_str(payload, 100)}"'
-        )
+        is_debug_enabled = logger.isEnabledFor(logging.DEBUG)
+        if is_debug_enabled:
+            context.logger.debug(
+                f'message="Sending chat GPT completions request to {self._name}" payload="{truncate_dict_values_to_str(payload, 100)}"'
+            )
         with DurationManager() as timer:
             r = self._post_request(payload)
-        context.logger.debug(
-            f'message="Got chat GPT completions result from {self._name}" id="{r.id}" model="{r.model}" {r.usage}'
-        )
+        if is_debug_enabled:
+            context.logger.debug(
+                f'message="Got chat GPT completions result from {self._name}" id="{r.id}" model="{r.model}" {r.usage}'
+            )
         return LLMResult(
             choices=[c.message.content for c in r.choices],
             consumptions=r.to_consumptions(timer.duration),
@@ -152,18 +164,22 @@ class OpenAIChatCompletionsModel(LLMBase[ChatGPTConfigurationBase]):
         payload = self._configuration.build_default_payload()
         msgs = []
         for message in messages:
-            content: List[Dict[str, Any]] = [{"type": "text", "text": message.content}]
-            result: Dict[str, Any] = {"role": message.role.value}
+            result: Dict[str, Any] = {"role": message.role._value_}
             if message.name is not None:
                 result["name"] = message.name
-            for data in message.data:
-                if data.is_image:
-                    content.append(
-                        {"type": "image_url", "image_url": {"url": f"data:{data.mime_type};base64,{data.content}"}}
-                    )
-                elif data.is_url:
-                    content.append({"type": "image_url", "image_url": {"url": f"{data.content}"}})
-            result["content"] = content
+            images = [data for data in message.data if data.is_image or data.is_url]
+            if len(images) == 0:
+                result["content"] = message.content
+            else:
+                content: List[Dict[str, Any]] = [{"type": "text", "text": message.content}]
+                for data in images:
+                    if data.is_image:
+                        content.append(
+                            {"type": "image_url", "image_url": {"url": f"data:{data.mime_type};base64,{data.content}"}}
+                        )
+                    else:
+                        content.append({"type": "image_url", "image_url": {"url": f"{data.content}"}})
+                result["content"] = content
             msgs.append(result)
         payload["messages"] = msgs
         return payload
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import weakref
 from typing import Any, Optional
 
 import httpx
@@ -19,20 +20,21 @@ class OpenAIChatCompletionsModelProvider:
 
     def __init__(self, config: OpenAIChatGPTConfiguration, name: Optional[str] = None) -> None:
         self.config = config
-        bearer = f"Bearer {config.api_key.unwrap()}"
-        self._headers = {"Authorization": bearer, "Content-Type": "application/json"}
         self._name = name
+        # the client is kept to reuse its connections; everything else is read from the config on each request
+        self._client = httpx.Client()
+        weakref.finalize(self, self._client.close)
 
     def post_request(self, payload: dict[str, Any]) -> httpx.Response:
         """
         Posts a request to the OpenAI chat completions endpoint.
         """
         uri = self.config.api_host.unwrap() + "/v1/chat/completions"
+        headers = {"Authorization": f"Bearer {self.config.api_key.unwrap()}", "Content-Type": "application/json"}
 
         timeout = self.config.timeout.unwrap()
         try:
-            with httpx.Client(timeout=timeout) as client:
-                return client.post(url=uri, headers=self._headers, json=payload)
+            return self._client.post(url=uri, headers=headers, json=payload, timeout=timeout)
         except TimeoutException as e:
             raise LLMCallTimeoutException(timeout=timeout, llm_name=self._name) from e
         except HTTPStatusError as e:
@@ -22,6 +22,8 @@ class Usage:
     - Subtracts cached_tokens from prompt_tokens to avoid double-counting
     """
 
+    __slots__ = ("_completion", "_prompt", "_total", "_reasoning", "_cached")
+
     def __init__(
         self, completion_tokens: int, prompt_tokens: int, total_tokens: int, reasoning_tokens: int, cached_tokens: int
     ) -> None:
@@ -84,18 +86,15 @@ class OpenAIConsumptionCalculator(LLMConsumptionCalculatorBase):
     COSTS_gpt_4_FAMILY: Mapping[str, LLMCostCard] = _cost_manager.get_cost_map("gpt_4_family")
     COSTS_gpt_4o_FAMILY: Mapping[str, LLMCostCard] = _cost_manager.get_cost_map("gpt_4o_family")
     COSTS_o1_FAMILY: Mapping[str, LLMCostCard] = _cost_manager.get_cost_map("o1_family")
+    COSTS: Mapping[str, LLMCostCard] = {
+        **COSTS_gpt_35_turbo_FAMILY,
+        **COSTS_gpt_4_FAMILY,
+        **COSTS_gpt_4o_FAMILY,
+        **COSTS_o1_FAMILY,
+    }
 
     def find_model_costs(self) -> Optional[LLMCostCard]:
-        if self.model.startswith("o1"):
-            return self.COSTS_o1_FAMILY.get(self.model)
-        elif self.model.startswith("gpt-4o"):
-            return self.COSTS_gpt_4o_FAMILY.get(self.model)
-        elif self.model.startswith("gpt-4"):
-            return self.COSTS_gpt_4_FAMILY.get(self.model)
-        elif self.model.startswith("gpt-3.5-turbo"):
-            return self.COSTS_gpt_35_turbo_FAMILY.get(self.model)
-
-        return None
+        return self.COSTS.get(self.model)
 
     def get_consumptions(self, duration: float, usage: Usage) -> List[Consumption]:
         """
@@ -5,7 +5,6 @@ import random
 from collections import defaultdict
 from typing import Any, Counter, DefaultDict, Dict, List, Mapping, Optional, Sequence
 
-import yaml
 from council.llm.base import LLMMessage
 from council.llm.llm_function import LLMResponse
 from council.utils import DataObject, DataObjectSpecBase
@@ -98,10 +97,9 @@ class LLMDatasetObject(DataObject[LLMDatasetSpec]):
 
     @classmethod
     def from_yaml(cls, filename: str) -> LLMDatasetObject:
-        with open(filename, "r", encoding="utf-8") as f:
-            values = yaml.safe_load(f)
-            cls._check_kind(values, "LLMDataset")
-            return LLMDatasetObject.from_dict(values)
+        values = cls._load_yaml(filename)
+        cls._check_kind(values, "LLMDataset")
+        return LLMDatasetObject.from_dict(values)
 
     @property
     def system_prompt(self) -> Optional[str]:
@@ -2,11 +2,12 @@ from __future__ import annotations
 
 from typing import Any, Dict, List, Mapping, Optional, Sequence
 
-import yaml
 from council.utils import DataObject, DataObjectSpecBase
 
 
 class LLMPromptTemplate:
+    __slots__ = ("_template", "_model", "_model_family")
+
     def __init__(self, template: str, model: Optional[str], model_family: Optional[str]) -> None:
         self._template = template
         self._model = model
@@ -37,12 +38,9 @@ class LLMPromptTemplate:
         return self._template
 
     def is_compatible(self, model: str) -> bool:
-        if self._model is not None and self._model == model:
-            return True
-
-        if self._model_family is not None and model.startswith(self._model_family):
+        if self._model == model:
             return True
-        return False
+        return self._model_family is not None and model.startswith(self._model_family)
 
 
 class LLMPromptConfigSpec(DataObjectSpecBase):
@@ -88,10 +86,9 @@ class LLMPromptConfigObject(DataObject[LLMPromptConfigSpec]):
 
     @classmethod
     def from_yaml(cls, filename: str) -> LLMPromptConfigObject:
-        with open(filename, "r", encoding="utf-8") as f:
-            values = yaml.safe_load(f)
-            cls._check_kind(values, "LLMPrompt")
-            return LLMPromptConfigObject.from_dict(values)
+        values = cls._load_yaml(filename)
+        cls._check_kind(values, "LLMPrompt")
+        return LLMPromptConfigObject.from_dict(values)
 
     @property
     def has_user_prompt_template(self) -> bool:
@@ -126,10 +123,13 @@ class LLMPromptConfigObject(DataObject[LLMPromptConfigSpec]):
         Raises:
             ValueError: if both prompt template for a given model and default prompt template are not provided
         """
-        try:
-            return next(prompt.template for prompt in prompts if prompt.is_compatible(model))
-        except StopIteration:
-            try:
-                return next(prompt.template for prompt in prompts if prompt.is_compatible("default"))
-            except StopIteration:
-                raise ValueError(f"No prompt template for a given model `{model}` nor a default one")
+        default_template: Optional[str] = None
+        for prompt in prompts:
+            if prompt.is_compatible(model):
+                return prompt.template
+            if default_template is None and prompt.is_compatible("default"):
+                default_template = prompt.template
+
+        if default_template is None:
+            raise ValueError(f"No prompt template for a given model `{model}` nor a default one")
+        return default_template
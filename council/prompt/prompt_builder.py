@@ -1,7 +1,18 @@
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
 
-from council.contexts import ChainContext, ChatMessageKind, ContextBase
-from jinja2 import Template
+from council.contexts import ChainContext, ChatMessage, ChatMessageKind, ContextBase
+from jinja2 import Template, meta
+
+
+@lru_cache(maxsize=256)
+def _compile_template(t: str) -> Tuple[Template, FrozenSet[str]]:
+    """
+    Compiles a Jinja2 template and collects the variables it references.
+    Compiled templates are immutable, so builders created from the same template string share them.
+    """
+    template = Template(t)
+    return template, frozenset(meta.find_undeclared_variables(template.environment.parse(t)))
 
 
 class PromptBuilder:
@@ -15,6 +26,8 @@ class PromptBuilder:
     Attributes:
         _template (Template): The Jinja2 template object.
         _instructions (str): The instructions to be appended to the prompt.
+        _variables (FrozenSet[str]): The variables referenced by the template.
+        _static_prompt (Optional[str]): The prompt rendered once, when the template does not depend on the context.
 
     Methods:
         apply(context: ChainContext) -> str:
@@ -31,7 +44,9 @@ class PromptBuilder:
             instructions (Optional[List[str]]): Optional instructions to be appended to the prompt.
         """
 
-        self._template = Template(t)
+        self._template, self._variables = _compile_template(t)
+        # a template without any expression nor statement renders to the same prompt for every context
+        self._static_prompt = self._template.render() if "{{" not in t and "{%" not in t else None
         if instructions is not None and len(instructions) > 0:
             self._instructions = "\n".join(["# INSTRUCTIONS"] + instructions) + "\n"
         else:
@@ -49,37 +64,43 @@ class PromptBuilder:
 
         """
 
-        template_context = {
-            "chat_history": self._build_chat_history(context),
-            "chain_history": self._build_chain_history(context),
-            "instructions": self._instructions,
-            **kwargs,
-        }
+        if self._static_prompt is not None:
+            return self._static_prompt
+
+        # histories are only built when the template references them
+        template_context: Dict[str, Any] = {"instructions": self._instructions}
+        if "chat_history" in self._variables:
+            template_context["chat_history"] = self._build_chat_history(context)
+        if "chain_history" in self._variables:
+            template_context["chain_history"] = self._build_chain_history(context)
+        template_context.update(kwargs)
 
         prompt = self._template.render(template_context)
         return prompt
 
     @staticmethod
     def _build_chat_history(context: ContextBase) -> Dict[str, Any]:
-        last_message = context.chat_history.try_last_message
-        last_user_message = context.chat_history.try_last_user_message
-        last_agent_message = context.chat_history.try_last_agent_message
+        messages: List[ChatMessage] = []
+        agent_messages: List[str] = []
+        user_messages: List[str] = []
+        for msg in context.chat_history.messages:
+            messages.append(msg)
+            if msg.kind is ChatMessageKind.Agent:
+                agent_messages.append(msg.message)
+            elif msg.kind is ChatMessageKind.User:
+                user_messages.append(msg.message)
 
         return {
             "agent": {
-                "messages": [
-                    msg.message for msg in context.chat_history.messages if msg.is_of_kind(ChatMessageKind.Agent)
-                ],
-                "last_message": last_agent_message.map_or(lambda m: m.message, ""),
+                "messages": agent_messages,
+                "last_message": agent_messages[-1] if agent_messages else "",
             },
             "user": {
-                "messages": [
-                    msg.message for msg in context.chat_history.messages if msg.is_of_kind(ChatMessageKind.User)
-                ],
-                "last_message": last_user_message.map_or(lambda m: m.message, ""),
+                "messages": user_messages,
+                "last_message": user_messages[-1] if user_messages else "",
             },
-            "messages": [msg for msg in context.chat_history.messages],
-            "last_message": last_message.map_or(lambda m: m.message, ""),
+            "messages": messages,
+            "last_message": messages[-1].message if messages else "",
         }
 
     @staticmethod
@@ -3,5 +3,5 @@ from concurrent import futures
 RunnerExecutor = futures.ThreadPoolExecutor
 
 
-def new_runner_executor(name: str = "skill_runner") -> RunnerExecutor:
-    return RunnerExecutor(thread_name_prefix=name, max_workers=10)
+def new_runner_executor(name: str = "skill_runner", max_workers: int = 10) -> RunnerExecutor:
+    return RunnerExecutor(thread_name_prefix=name, max_workers=max_workers)
@@ -6,6 +6,11 @@ from typing import Any, Dict, Generic, List, Optional, Type, TypeVar, Union
 import yaml
 from typing_extensions import Self
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader  # type: ignore[assignment]
+
 Label = Optional[Union[str, List[str]]]
 
 
@@ -99,6 +104,11 @@ class DataObject(Generic[T]):
         spec = inner.from_dict(values["spec"])
         return cls(values["kind"], values["version"], metadata, spec)
 
+    @staticmethod
+    def _load_yaml(filename: str) -> Dict[str, Any]:
+        with open(filename, "r", encoding="utf-8") as f:
+            return yaml.load(f, Loader=SafeLoader)
+
     def to_yaml(self, filename: str) -> None:
         values = self.to_dict()
         with open(filename, "w", encoding="utf-8") as f:
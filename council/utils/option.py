@@ -88,7 +88,7 @@ class Option(Generic[T]):
         """
         Returns `True` is this instance contains some value
         """
-        return not self.is_none()
+        return self._some is not None
 
     @staticmethod
     def some(some: T) -> Option[T]:
@@ -49,7 +49,7 @@ class TestLlmAzure(unittest.TestCase):
             llm = AzureLLM.from_env()
             messages = [LLMMessage.user_message("Give me an example of a currency")]
             result = llm.post_chat_request(LLMContext.empty(), messages)
-            self.assertEquals(3, len(result.choices))
+            self.assertEqual(3, len(result.choices))
             [print("\n- Choice:" + choice) for choice in result.choices]
 
     def test_invalid_temperature(self):
@@ -44,14 +44,14 @@ class TestLlmSkill(unittest.TestCase):
             agent = Agent.from_skill(llm_skill, "Answer to an user prompt using gpt4")
             result = agent.execute_from_user_message("Give me examples of a currency", budget=Budget(6000))
             self.assertTrue(result.try_best_message.is_some())
-            self.assertEquals(3, len(result.best_message.data.choices))
+            self.assertEqual(3, len(result.best_message.data.choices))
 
         finally:
             del os.environ["AZURE_LLM_N"]
             del os.environ["AZURE_LLM_TEMPERATURE"]
 
-        self.assertEquals(os.getenv("AZURE_LLM_N"), None)
-        self.assertEquals(os.getenv("AZURE_LLM_TEMPERATURE"), None)
+        self.assertEqual(os.getenv("AZURE_LLM_N"), None)
+        self.assertEqual(os.getenv("AZURE_LLM_TEMPERATURE"), None)
 
     def test_template_prompt(self):
         llm = MockLLM(action=first_llm_message_content_to_str)
@@ -60,4 +60,4 @@ class TestLlmSkill(unittest.TestCase):
         result = agent.execute_from_user_message("User Message")
 
         self.assertTrue(result.try_best_message.is_some())
-        self.assertEquals(result.best_message.message, "The last user message is: 'User Message'")
+        self.assertEqual(result.best_message.message, "The last user message is: 'User Message'")
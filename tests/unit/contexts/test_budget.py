@@ -23,7 +23,7 @@ class TestBudget(unittest.TestCase):
         b.add_consumption(6, "unit", "test")
         b.add_consumption(50, "unit", "test2")
         self.assertFalse(b.is_expired())
-        self.assertEquals(4, consumption.value)
+        self.assertEqual(4, consumption.value)
         b.add_consumption(5, "unit", "test")
         self.assertTrue(b.is_expired())
 
@@ -0,0 +1,37 @@
+import unittest
+from enum import Enum
+
+from council.contexts import ChatMessage, ChatMessageKind
+
+
+class Names(str, Enum):
+    Skill = "a skill"
+
+
+class TestChatMessage(unittest.TestCase):
+    def test_with_kind(self):
+        message = ChatMessage.agent("a message", data={"key": "value"}, source="a source", is_error=True)
+
+        copy = message.with_kind(ChatMessageKind.Skill)
+
+        self.assertTrue(copy.is_kind_skill)
+        self.assertEqual("a message", copy.message)
+        self.assertEqual({"key": "value"}, copy.data)
+        self.assertTrue(copy.is_from_source("a source"))
+        self.assertTrue(copy.is_error)
+        self.assertFalse(copy.is_ok)
+        self.assertTrue(message.is_kind_agent)
+
+    def test_str_enum_source(self):
+        message = ChatMessage.skill("a message", source=Names.Skill)
+
+        self.assertIs(Names.Skill, message.source)
+        self.assertTrue(message.is_from_source("a skill"))
+        self.assertTrue(message.is_from_source(Names.Skill))
+
+    def test_is_ok_follows_is_error(self):
+        message = ChatMessage.skill("a message")
+        self.assertTrue(message.is_ok)
+
+        message.is_error = True
+        self.assertFalse(message.is_ok)
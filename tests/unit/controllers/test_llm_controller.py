@@ -1,4 +1,5 @@
 import unittest
+from typing import List
 
 from council.agents import Agent
 from council.chains import Chain
@@ -6,9 +7,21 @@ from council.controllers import LLMController, ControllerException
 from council.contexts import AgentContext, Budget
 from council.evaluators import BasicEvaluator
 from council.filters import BasicFilter
+from council.llm import ExecuteLLMRequest, LLMBase, LLMCachingMiddleware, LLMRequest, LLMResponse
 from council.mocks import MockLLM, MockSkill, MockMultipleResponses
 
 
+class RecordingCachingMiddleware(LLMCachingMiddleware):
+    def __init__(self) -> None:
+        super().__init__()
+        self.responses: List[LLMResponse] = []
+
+    def __call__(self, llm: LLMBase, execute: ExecuteLLMRequest, request: LLMRequest) -> LLMResponse:
+        response = super().__call__(llm, execute, request)
+        self.responses.append(response)
+        return response
+
+
 class LLMControllerTest(unittest.TestCase):
     def setUp(self) -> None:
         self.chains = [Chain("first", "", []), Chain("second", "", []), Chain("third", "", [])]
@@ -86,6 +99,76 @@ class LLMControllerTest(unittest.TestCase):
         result = controller.execute(self.context)
         self.assertEqual(["second", "first", "third"], [item.chain.name for item in result])
 
+    def test_plan_first_valid_choice(self):
+        llm_choices = [
+            "\n".join(
+                [
+                    "name: first<->score: 10<->instructions: None<->justification: because",
+                    "name: second<->instructions: None<->justification: Missing Score",
+                ]
+            ),
+            "\n".join(
+                [
+                    "name: first<->score: 4<->instructions: None<->justification: because",
+                    "name: second<->score: 6<->instructions: None<->justification: because",
+                    "name: third<->score: 2<->instructions: None<->justification: because",
+                ]
+            ),
+        ]
+
+        llm = MockLLM.from_responses(llm_choices)
+
+        controller = LLMController(chains=self.chains, llm=llm, top_k=3)
+        result = controller.execute(self.context)
+        self.assertEqual(["second", "first", "third"], [item.chain.name for item in result])
+
+    def test_plan_cached(self):
+        llm_responses = [
+            [
+                "name: first<->score: 10<->instructions: None<->justification: because",
+                "name: second<->score: 6<->instructions: None<->justification: because",
+                "name: third<->score: 2<->instructions: None<->justification: because",
+            ],
+            [
+                "name: first<->score: 2<->instructions: None<->justification: because",
+                "name: second<->score: 6<->instructions: None<->justification: because",
+                "name: third<->score: 10<->instructions: None<->justification: because",
+            ],
+        ]
+
+        llm = MockLLM(action=MockMultipleResponses(responses=llm_responses))
+
+        controller = LLMController(chains=self.chains, llm=llm, llm_cache=LLMCachingMiddleware())
+        first = controller.execute(self.context)
+        second = controller.execute(self.context)
+        self.assertEqual(["first", "second", "third"], [item.chain.name for item in first])
+        self.assertEqual(["first", "second", "third"], [item.chain.name for item in second])
+
+    def test_plan_retry_after_cached(self):
+        llm_responses = [
+            [
+                "name: first<->score: 10<->instructions: None<->justification: because",
+                "name: second<->instructions: None<->justification: Missing Score",
+                "name: third<->score: 2<->instructions: None<->justification: because",
+            ],
+            [
+                "name: first<->score: 4<->instructions: None<->justification: because",
+                "name: second<->score: 6<->instructions: None<->justification: because",
+                "name: third<->score: 2<->instructions: None<->justification: because",
+            ],
+        ]
+
+        llm = MockLLM(action=MockMultipleResponses(responses=llm_responses))
+        llm_cache = RecordingCachingMiddleware()
+
+        controller = LLMController(chains=self.chains, llm=llm, top_k=3, llm_cache=llm_cache)
+        first = controller.execute(self.context)
+        second = controller.execute(AgentContext.from_user_message("bla", Budget(10)))
+
+        self.assertEqual(["second", "first", "third"], [item.chain.name for item in first])
+        self.assertEqual(["second", "first", "third"], [item.chain.name for item in second])
+        self.assertEqual([2, 4, 2, 4], [len(response.request.messages) for response in llm_cache.responses])
+
     def test_plan_fail(self):
         invalid_llm_responses = [
             [
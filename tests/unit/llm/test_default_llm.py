@@ -0,0 +1,40 @@
+import unittest
+from unittest.mock import patch
+
+from council.llm import AnthropicLLM, OpenAILLM, get_default_llm
+from council.mocks import MockLLM
+from council.utils import OsEnviron
+
+
+class TestGetDefaultLLM(unittest.TestCase):
+    def setUp(self) -> None:
+        self.llm = MockLLM.from_response("a response")
+
+    def test_provider_name(self):
+        with OsEnviron("COUNCIL_DEFAULT_LLM_PROVIDER", "openai"):
+            with patch.object(OpenAILLM, "from_env", return_value=self.llm) as from_env:
+                self.assertIs(self.llm, get_default_llm())
+        from_env.assert_called_once()
+
+    def test_provider_spec_name(self):
+        with OsEnviron("COUNCIL_DEFAULT_LLM_PROVIDER", "openAISpec"):
+            with patch.object(OpenAILLM, "from_env", return_value=self.llm) as from_env:
+                self.assertIs(self.llm, get_default_llm())
+        from_env.assert_called_once()
+
+    def test_provider_other_case(self):
+        with OsEnviron("COUNCIL_DEFAULT_LLM_PROVIDER", "Anthropic"):
+            with patch.object(AnthropicLLM, "from_env", return_value=self.llm) as from_env:
+                self.assertIs(self.llm, get_default_llm())
+        from_env.assert_called_once()
+
+    def test_provider_unset(self):
+        with OsEnviron("COUNCIL_DEFAULT_LLM_PROVIDER"):
+            with patch.object(OpenAILLM, "from_env", return_value=self.llm) as from_env:
+                self.assertIs(self.llm, get_default_llm())
+        from_env.assert_called_once()
+
+    def test_provider_not_supported(self):
+        with OsEnviron("COUNCIL_DEFAULT_LLM_PROVIDER", "unknown"):
+            with self.assertRaises(ValueError):
+                _ = get_default_llm()
@@ -1,4 +1,5 @@
 import unittest
+from unittest.mock import Mock
 
 from council.contexts import LLMContext
 from council.llm import LLMFallback, LLMCallException
@@ -54,3 +55,14 @@ class TestLLMFallBack(unittest.TestCase):
         self.assertEqual(e.exception.code, 403)
         self.assertEqual(e.exception.__cause__.code, 401)
         self.assertIn("Wrong status code: 403", str(e.exception))
+
+    def test_self_fallback_with_non_retryable_error(self):
+        m = MockErrorLLM(exception=LLMCallException(401, "Unauthorized", "mock-401"))
+        m._post_chat_request = Mock(wraps=m._post_chat_request)
+
+        fb_llm = LLMFallback(m, m, retry_before_fallback=3)
+
+        with self.assertRaises(LLMCallException):
+            _r = fb_llm.post_chat_request(LLMContext.empty(), [])
+
+        self.assertEqual(1, m._post_chat_request.call_count)
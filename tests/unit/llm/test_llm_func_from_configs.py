@@ -1,5 +1,6 @@
 import os
 import shutil
+import tempfile
 import unittest
 
 from council.llm import LLMCacheControlData, LLMFunctionWithPrompt, OpenAIChatGPTConfiguration
@@ -9,42 +10,42 @@ from tests.unit import LLMPrompts, LLMModels
 
 
 class TestLLMFunctionWithPromptFromConfigs(unittest.TestCase):
-    def setUp(self):
-        # Create temporary directories
-        module_path = os.path.dirname(__file__)
-
-        self.data_dir = os.path.join(module_path, "data")
-        os.makedirs(self.data_dir, exist_ok=True)
+    @classmethod
+    def setUpClass(cls):
+        environ = OsEnviron("OPENAI_API_KEY", "sk-key")
+        environ.__enter__()
+        cls.addClassCleanup(environ.__exit__, None, None, None)
 
-        self.data_dir_internal = os.path.join(module_path, "another_data", "inner")
-        os.makedirs(self.data_dir_internal, exist_ok=True)
+        # the fixture files are only read by the tests, so a single tree is shared by all of them
+        cls.root_dir = tempfile.mkdtemp()
 
-        self.data_dir_external = os.path.join(module_path, "..", "external_data")
-        os.makedirs(self.data_dir_external, exist_ok=True)
+        cls.data_dir = os.path.join(cls.root_dir, "data")
+        cls.data_dir_internal = os.path.join(cls.root_dir, "another_data", "inner")
+        cls.data_dir_external = os.path.join(cls.root_dir, "external_data")
+        for directory in [cls.data_dir, cls.data_dir_internal, cls.data_dir_external]:
+            os.makedirs(directory)
 
         llm_config_path = get_data_filename(LLMModels.OpenAI)
         prompt_path = get_data_filename(LLMPrompts.sample)
 
-        shutil.copy(prompt_path, os.path.join(self.data_dir, "llm-prompt.yaml"))
-        shutil.copy(llm_config_path, os.path.join(self.data_dir, "llm-config.yaml"))
-        shutil.copy(llm_config_path, os.path.join(self.data_dir, "llm-config-v2.yaml"))
+        shutil.copy(prompt_path, os.path.join(cls.data_dir, "llm-prompt.yaml"))
+        shutil.copy(llm_config_path, os.path.join(cls.data_dir, "llm-config.yaml"))
+        shutil.copy(llm_config_path, os.path.join(cls.data_dir, "llm-config-v2.yaml"))
 
-        shutil.copy(prompt_path, os.path.join(self.data_dir_internal, "llm-prompt.yaml"))
-        shutil.copy(llm_config_path, os.path.join(self.data_dir_internal, "llm-config.yaml"))
-        shutil.copy(prompt_path, os.path.join(self.data_dir_internal, "llm-prompt-v2.yaml"))
+        shutil.copy(prompt_path, os.path.join(cls.data_dir_internal, "llm-prompt.yaml"))
+        shutil.copy(llm_config_path, os.path.join(cls.data_dir_internal, "llm-config.yaml"))
+        shutil.copy(prompt_path, os.path.join(cls.data_dir_internal, "llm-prompt-v2.yaml"))
 
-        shutil.copy(prompt_path, os.path.join(self.data_dir_external, "llm-prompt.yaml"))
-        shutil.copy(llm_config_path, os.path.join(self.data_dir_external, "llm-config.yaml"))
+        shutil.copy(prompt_path, os.path.join(cls.data_dir_external, "llm-prompt.yaml"))
+        shutil.copy(llm_config_path, os.path.join(cls.data_dir_external, "llm-config.yaml"))
 
-    def tearDown(self):
-        shutil.rmtree(self.data_dir)
-        shutil.rmtree(self.data_dir_internal)
-        shutil.rmtree(self.data_dir_external)
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls.root_dir)
 
     @classmethod
     def create_func(cls, *args, **kwargs):
-        with OsEnviron("OPENAI_API_KEY", "sk-key"):
-            return LLMFunctionWithPrompt.string_from_configs(*args, **kwargs)
+        return LLMFunctionWithPrompt.string_from_configs(*args, **kwargs)
 
     @classmethod
     def create_func_and_assert(cls, *args, **kwargs):
@@ -0,0 +1,56 @@
+import unittest
+from typing import Any, Dict, List
+
+import httpx
+
+from council.contexts import LLMContext
+from council.llm import LLMMessage, LLMMessageData, OpenAIChatGPTConfiguration
+from council.llm.base.providers.openai.openai_chat_completions_llm import OpenAIChatCompletionsModel
+
+
+class RecordingProvider:
+    def __init__(self) -> None:
+        self.payloads: List[Dict[str, Any]] = []
+
+    def __call__(self, payload: Dict[str, Any]) -> httpx.Response:
+        self.payloads.append(payload)
+        return httpx.Response(
+            200,
+            json={
+                "id": "id",
+                "object": "chat.completion",
+                "created": 0,
+                "model": "gpt-4o",
+                "choices": [
+                    {"index": 0, "finish_reason": "stop", "message": {"role": "assistant", "content": "response"}}
+                ],
+                "usage": {"prompt_tokens": 1, "completion_tokens": 1, "total_tokens": 2},
+            },
+        )
+
+
+class TestOpenAIChatCompletionsModel(unittest.TestCase):
+    def setUp(self) -> None:
+        config = OpenAIChatGPTConfiguration(api_key="sk-key", api_host="https://api.openai.com", model="gpt-4o")
+        self.provider = RecordingProvider()
+        self.llm = OpenAIChatCompletionsModel(config, self.provider, token_counter=None)
+
+    def test_text_only_message_content(self):
+        result = self.llm.post_chat_request(LLMContext.empty(), [LLMMessage.user_message("a message")])
+
+        self.assertEqual("response", result.first_choice)
+        self.assertEqual([{"role": "user", "content": "a message"}], self.provider.payloads[0]["messages"])
+
+    def test_message_with_image_and_url_content(self):
+        message = LLMMessage.user_message("a message")
+        message.add_data(LLMMessageData(content="aW1hZ2U=", mime_type="image/png"))
+        message.add_data(LLMMessageData.from_uri("https://example.com/image.png"))
+
+        self.llm.post_chat_request(LLMContext.empty(), [message])
+
+        expected = [
+            {"type": "text", "text": "a message"},
+            {"type": "image_url", "image_url": {"url": "data:image/png;base64,aW1hZ2U="}},
+            {"type": "image_url", "image_url": {"url": "https://example.com/image.png"}},
+        ]
+        self.assertEqual([{"role": "user", "content": expected}], self.provider.payloads[0]["messages"])
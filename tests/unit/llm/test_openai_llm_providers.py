@@ -0,0 +1,41 @@
+import unittest
+from unittest.mock import patch
+
+import httpx
+
+from council.llm import AzureChatGPTConfiguration, OpenAIChatGPTConfiguration
+from council.llm.base.providers.openai.azure_llm import AzureOpenAIChatCompletionsModelProvider
+from council.llm.base.providers.openai.openai_llm import OpenAIChatCompletionsModelProvider
+
+
+class TestOpenAIProviders(unittest.TestCase):
+    def test_openai_provider_reads_current_config(self):
+        config = OpenAIChatGPTConfiguration(api_key="sk-key", api_host="https://api.openai.com", model="gpt-4o")
+        provider = OpenAIChatCompletionsModelProvider(config, "openai")
+
+        config.api_key.set("sk-other-key")
+        config.api_host.set("https://other.host")
+        config.timeout.set(5)
+        with patch.object(httpx.Client, "post", return_value=httpx.Response(200)) as post:
+            provider.post_request({})
+
+        kwargs = post.call_args.kwargs
+        self.assertEqual("https://other.host/v1/chat/completions", kwargs["url"])
+        self.assertEqual("Bearer sk-other-key", kwargs["headers"]["Authorization"])
+        self.assertEqual(5, kwargs["timeout"])
+
+    def test_azure_provider_reads_current_config(self):
+        config = AzureChatGPTConfiguration(api_key="key", api_base="https://azure.host", deployment_name="deployment")
+        provider = AzureOpenAIChatCompletionsModelProvider(config, "azure")
+
+        config.api_key.set("other-key")
+        config.api_version.set("2024-01-01")
+        config.timeout.set(5)
+        with patch.object(httpx.Client, "post", return_value=httpx.Response(200)) as post:
+            provider.post_request({})
+
+        kwargs = post.call_args.kwargs
+        self.assertEqual("https://azure.host/openai/deployments/deployment/chat/completions", kwargs["url"])
+        self.assertEqual("other-key", kwargs["headers"]["api-key"])
+        self.assertEqual({"api-version": "2024-01-01"}, kwargs["params"])
+        self.assertEqual(5, kwargs["timeout"])
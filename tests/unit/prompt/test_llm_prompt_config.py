@@ -9,16 +9,19 @@ from .. import LLMPrompts
 
 
 class TestLLMPromptConfig(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # only read by the tests below
+        cls.sample_prompt = LLMPromptConfigObject.from_yaml(get_data_filename(LLMPrompts.sample))
+
     def test_llm_prompt_from_yaml(self):
-        filename = get_data_filename(LLMPrompts.sample)
-        actual = LLMPromptConfigObject.from_yaml(filename)
+        actual = self.sample_prompt
 
         assert isinstance(actual, LLMPromptConfigObject)
         assert actual.kind == "LLMPrompt"
 
     def test_llm_prompt_templates(self):
-        filename = get_data_filename(LLMPrompts.sample)
-        actual = LLMPromptConfigObject.from_yaml(filename)
+        actual = self.sample_prompt
 
         system_prompt_gpt4o = actual.get_system_prompt_template("gpt-4o")
         assert system_prompt_gpt4o.rstrip("\n") == "System prompt template specific for gpt-4o"
@@ -1,4 +1,5 @@
 import unittest
+from unittest.mock import patch
 
 from council.contexts import ChainContext, ChatHistory
 from council.prompt import PromptBuilder
@@ -77,3 +78,19 @@ class TestPrompt(unittest.TestCase):
 
         self.assertTrue(result.endswith("value"))
         print(result)
+
+    def test_static_template(self):
+        cc = ChainContext.from_user_message("what are the three largest cities in South America?")
+        prompt_builder = PromptBuilder("You are a helpful assistant.\n{# no context needed #}\n")
+        result = prompt_builder.apply(cc, test="value")
+
+        self.assertEqual("You are a helpful assistant.\n", result)
+
+    def test_unreferenced_history_not_built(self):
+        cc = ChainContext.from_user_message("what are the three largest cities in South America?")
+        prompt_builder = PromptBuilder("{{instructions}}{{test}}", instructions=["Be accurate"])
+        with patch.object(PromptBuilder, "_build_chat_history") as build_chat_history:
+            result = prompt_builder.apply(cc, test="value")
+
+        build_chat_history.assert_not_called()
+        self.assertTrue(result.endswith("value"))